@@ -1,44 +1,211 @@
 # Author: Jose Zacarias Silberio
 # Generador de claves RSA y cifrado/descifrado de mensajes con numeros primos
-import random
-from math import gcd
-
-def es_primo(n, k=5):
+import os
+import secrets
+from math import gcd, prod
+from multiprocessing import Pool
+
+try:
+    import gmpy2
+    from gmpy2 import mpz, powmod
+    # Exponenciación de tiempo constante (gmpy2 >= 2.1) para los exponentes privados
+    powmod_sec = getattr(gmpy2, 'powmod_sec', powmod)
+except ImportError:
+    gmpy2 = None
+    mpz = int
+    powmod = pow
+    powmod_sec = pow
+
+try:
+    from numba import njit, uint64
+except ImportError:
+    njit = None
+
+def criba_eratostenes(limite):
     """
-    Determina si un número entero n es primo usando la prueba de primalidad de Miller-Rabin.
+    Calcula todos los números primos menores que `limite` con la criba de Eratóstenes.
 
     Args:
-        n (int): Número a probar si es primo.
-        k (int, opcional): Número de iteraciones para la precisión de la prueba. Por defecto es 5.
+        limite (int): Cota superior (exclusiva) de los primos a calcular.
 
     Returns:
-        bool: True si n probablemente es primo, False si es compuesto.
-
-    Nota:
-        Esta es una prueba probabilística. Para números compuestos, la probabilidad de un falso positivo disminuye exponencialmente al aumentar k.
+        list[int]: Lista ordenada de los primos menores que `limite`.
     """
-    if n <= 1:
-        return False
-    elif n <= 3:
+    criba = bytearray([1]) * limite
+    criba[:2] = b'\x00\x00'
+    for i in range(2, int(limite ** 0.5) + 1):
+        if criba[i]:
+            criba[i*i::i] = bytes(len(range(i*i, limite, i)))
+    return [i for i in range(limite) if criba[i]]
+
+# Primos pequeños para descartar candidatos antes de Miller-Rabin: un solo gcd con su producto
+# sustituye a una división por cada primo
+LIMITE_PRIMOS_PEQUENOS = 2000
+PRIMOS_PEQUENOS = frozenset(criba_eratostenes(LIMITE_PRIMOS_PEQUENOS))
+PRIMORIAL = prod(PRIMOS_PEQUENOS)
+
+# Con los primos hasta 41 como testigos, Miller-Rabin es exacto para todo n < COTA_DETERMINISTA (~3.3e24);
+# hasta 37 no basta: 318665857834031151167461 es pseudoprimo fuerte para todas esas bases
+TESTIGOS_DETERMINISTAS = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+COTA_DETERMINISTA = 3317044064679887385961981
+
+# Criba de candidatos en generar_primo: número de impares por ventana y primos impares con que se criban
+VENTANA_CRIBA = 1 << 14
+PRIMOS_CRIBA = criba_eratostenes(50000)[1:]
+
+# Exponentes públicos candidatos (todos primos), en orden de preferencia. Basta con que uno no divida a phi,
+# así que la búsqueda es acotada; con primos grandes 65537 prácticamente siempre sirve
+EXPONENTES_PUBLICOS = (65537, 3, 5, 17, 257, 65539, 65543)
+
+# Tamaño mínimo de primo (en bits) a partir del cual generar_primos_paralelo reparte la búsqueda entre procesos
+BITS_MIN_PARALELO = 1024
+
+if njit is not None:
+    # Miller-Rabin compilado para n < 2**64 con aritmética uint64 y multiplicación de Montgomery (R = 2**64).
+    # Se compila en la primera llamada y sin caché en disco: el nombre del script no es un módulo importable.
+    @njit
+    def _mulhi64(a, b):
+        m32 = uint64(0xFFFFFFFF)
+        c32 = uint64(32)
+        a_lo, a_hi = a & m32, a >> c32
+        b_lo, b_hi = b & m32, b >> c32
+        p0 = a_lo * b_lo
+        p1 = a_lo * b_hi
+        p2 = a_hi * b_lo
+        medio = (p0 >> c32) + (p1 & m32) + (p2 & m32)
+        return a_hi * b_hi + (p1 >> c32) + (p2 >> c32) + (medio >> c32)
+
+    @njit
+    def _montmul64(a, b, n, n_inv):
+        # REDC(a*b): (a*b + m*n) / R con m = (a*b mod R) * n_inv mod R, vigilando el acarreo cuando n >= 2**63
+        alto = _mulhi64(a, b)
+        bajo = a * b
+        t = alto + _mulhi64(bajo * n_inv, n)
+        desborde = t < alto
+        if bajo != uint64(0):
+            t += uint64(1)
+            desborde = desborde or t == uint64(0)
+        return t - n if desborde or t >= n else t
+
+    @njit
+    def _mr64(n_alto, n_bajo, testigos):
+        # n llega partido en dos mitades de 32 bits porque numba tipa los enteros de Python como int64
+        uno = uint64(1)
+        n = (uint64(n_alto) << uint64(32)) | uint64(n_bajo)
+        # n_inv = -n^-1 mod R por iteración de Newton (cada paso duplica los bits correctos)
+        inv = n
+        for _ in range(5):
+            inv *= uint64(2) - n * inv
+        n_inv = uint64(0) - inv
+        # r = R mod n es el 1 en forma de Montgomery; r2 = R**2 mod n convierte los testigos a esa forma
+        r = (uint64(0) - n) % n
+        r2 = r
+        for _ in range(64):
+            r2 = r2 - (n - r2) if r2 >= n - r2 else r2 + r2
+        menos_uno = n - r
+        d = n - uno
+        s = 0
+        while d & uno == uint64(0):
+            d >>= uno
+            s += 1
+        for a in testigos:
+            base = _montmul64(uint64(a) % n, r2, n, n_inv)
+            x = r
+            e = d
+            while e > uint64(0):
+                if e & uno:
+                    x = _montmul64(x, base, n, n_inv)
+                base = _montmul64(base, base, n, n_inv)
+                e >>= uno
+            if x == r or x == menos_uno:
+                continue
+            compuesto = True
+            for _ in range(s - 1):
+                x = _montmul64(x, x, n, n_inv)
+                if x == menos_uno:
+                    compuesto = False
+                    break
+            if compuesto:
+                return False
         return True
-    d = n - 1
+else:
+    _mr64 = None
+
+def _miller_rabin(n, testigos):
+    """
+    Ejecuta las rondas de Miller-Rabin sobre un n impar mayor que 3 con los testigos dados.
+
+    Args:
+        n (int): Número impar a probar.
+        testigos (iterable[int]): Bases a usar, todas en el rango [2, n-2].
+
+    Returns:
+        bool: False si algún testigo demuestra que n es compuesto, True en caso contrario.
+    """
+    n_menos_1 = n - 1
+    d = n_menos_1
     s = 0
     while d % 2 == 0:
         d //= 2
         s += 1
-    for _ in range(k):
-        a = random.randint(2, n - 2)
-        x = pow(a, d, n)
-        if x == 1 or x == n - 1:
+    # Nombres locales: evitan buscar `pow` en builtins y recalcular n - 1 en cada iteración
+    _pow = pow
+    rondas = range(s - 1)
+    for a in testigos:
+        x = _pow(a, d, n)
+        if x == 1 or x == n_menos_1:
             continue
-        for __ in range(s - 1):
-            x = pow(x, 2, n)
-            if x == n - 1:
+        for __ in rondas:
+            x = _pow(x, 2, n)
+            if x == n_menos_1:
                 break
         else:
             return False
     return True
 
+def es_primo(n, k=25):
+    """
+    Determina si un número entero n es primo usando la prueba de primalidad de Miller-Rabin.
+
+    Args:
+        n (int): Número a probar si es primo.
+        k (int, opcional): Número de iteraciones para la precisión de la prueba cuando n >= `COTA_DETERMINISTA`.
+            Por defecto es 25.
+
+    Returns:
+        bool: True si n es primo (probablemente, si n >= `COTA_DETERMINISTA`), False si es compuesto.
+
+    Nota:
+        - Para n < `COTA_DETERMINISTA` se usan los testigos fijos `TESTIGOS_DETERMINISTAS` y el resultado es exacto.
+        - Para n mayores la prueba es probabilística. Para números compuestos, la probabilidad de un falso positivo disminuye exponencialmente al aumentar k.
+        - Si `numba` está instalado y n < 2**64, Miller-Rabin se ejecuta en una versión compilada con `numba.njit`.
+        - Si `gmpy2` está instalado y n >= `COTA_DETERMINISTA`, la prueba se delega a `gmpy2.is_prime` (GMP en C, que
+          ya hace su propia división por primos pequeños); si no, se descartan los múltiplos de `PRIMOS_PEQUENOS` con un gcd
+          y se usa la implementación en Python.
+    """
+    if n <= 1:
+        return False
+    elif n <= 3:
+        return True
+    elif n % 2 == 0:
+        return False
+    if _mr64 is not None and n.bit_length() <= 64:
+        if n in TESTIGOS_DETERMINISTAS:
+            return True
+        return _mr64(n >> 32, n & 0xFFFFFFFF, TESTIGOS_DETERMINISTAS)
+    if gmpy2 is not None and n >= COTA_DETERMINISTA:
+        return gmpy2.is_prime(gmpy2.mpz(n), k)
+    if gcd(n, PRIMORIAL) != 1:
+        return n in PRIMOS_PEQUENOS
+    if n < LIMITE_PRIMOS_PEQUENOS ** 2:
+        return True
+    if n < COTA_DETERMINISTA:
+        return _miller_rabin(n, TESTIGOS_DETERMINISTAS)
+    n_bytes = (n.bit_length() + 7) // 8
+    n_menos_3 = n - 3
+    urandom, from_bytes = os.urandom, int.from_bytes
+    return _miller_rabin(n, (from_bytes(urandom(n_bytes), 'big') % n_menos_3 + 2 for _ in range(k)))
+
 def generar_primo(bits=1024):
     """
     Genera un número primo aleatorio del tamaño de bits especificado.
@@ -50,16 +217,75 @@ def generar_primo(bits=1024):
         int: Un número primo con la cantidad de bits especificada.
 
     Notas:
-        - La función genera repetidamente números impares aleatorios del tamaño de bits dado
-          y los prueba para primalidad usando la función `es_primo` hasta encontrar un primo.
+        - Si `gmpy2` está instalado, la búsqueda completa se hace en C con `gmpy2.next_prime` (`mpz_nextprime` de GMP)
+          a partir de un número aleatorio del tamaño dado; si el primo siguiente se sale de los bits pedidos, se
+          elige otro punto de partida.
+        - Sin `gmpy2`, la función elige una base aleatoria impar `p0` del tamaño de bits dado y criba la ventana
+          `p0, p0+2, ..., p0+2*(VENTANA_CRIBA-1)` con `PRIMOS_CRIBA`; solo los candidatos que sobreviven
+          se prueban con `es_primo`. Si la ventana se agota sin encontrar un primo, se elige otra base.
         - El número generado siempre tendrá el bit más alto activado (garantizando el tamaño en bits)
           y será impar.
     """
+    limite = 1 << bits
+    n_bytes = (bits + 7) // 8
+    sobrante = 8 * n_bytes - bits
+    if gmpy2 is not None:
+        while True:
+            inicio = int.from_bytes(os.urandom(n_bytes), 'big') >> sobrante
+            p = gmpy2.next_prime(mpz(inicio | (1 << bits - 1)))
+            if p < limite:
+                return int(p)
     while True:
-        p = random.getrandbits(bits)
-        p |= (1 << bits - 1) | 1
-        if es_primo(p):
-            return p
+        p0 = int.from_bytes(os.urandom(n_bytes), 'big') >> sobrante
+        p0 |= (1 << bits - 1) | 1
+        criba = bytearray([1]) * VENTANA_CRIBA
+        for q in PRIMOS_CRIBA:
+            if q >= p0:
+                break
+            # Primer índice i con p0 + 2*i ≡ 0 (mod q); (q + 1) // 2 es el inverso de 2 módulo q
+            inicio = (-(p0 % q) * ((q + 1) // 2)) % q
+            criba[inicio::q] = bytes(len(range(inicio, VENTANA_CRIBA, q)))
+        i = criba.find(1)
+        while i != -1:
+            p = p0 + 2 * i
+            if p >= limite:
+                break
+            if es_primo(p):
+                return p
+            i = criba.find(1, i + 1)
+
+def generar_primos_paralelo(bits, cantidad=2):
+    """
+    Genera `cantidad` primos distintos del tamaño de bits especificado repartiendo la búsqueda entre procesos.
+
+    Args:
+        bits (int): Número de bits de cada primo.
+        cantidad (int, opcional): Número de primos distintos a generar. Por defecto es 2.
+
+    Returns:
+        list[int]: Lista con `cantidad` primos distintos, en el orden en que se encontraron.
+
+    Nota:
+        - Se lanzan `2 * os.cpu_count()` búsquedas independientes de `generar_primo` y se toman los primeros
+          resultados distintos; después se terminan los procesos, con lo que las búsquedas restantes se detienen.
+        - Con un solo procesador, con primos de menos de `BITS_MIN_PARALELO` bits (donde arrancar los procesos cuesta
+          más que la búsqueda) o si no se obtienen suficientes primos distintos, se buscan en el proceso actual.
+    """
+    trabajadores = os.cpu_count() or 1
+    primos = []
+    if trabajadores > 1 and bits >= BITS_MIN_PARALELO:
+        # Al salir del bloque `with` el pool se termina, deteniendo las búsquedas que sigan en curso
+        with Pool(trabajadores) as pool:
+            for primo in pool.imap_unordered(generar_primo, [bits] * (2 * trabajadores)):
+                if primo not in primos:
+                    primos.append(primo)
+                    if len(primos) == cantidad:
+                        break
+    while len(primos) < cantidad:
+        primo = generar_primo(bits)
+        if primo not in primos:
+            primos.append(primo)
+    return primos
 
 def generar_claves(bits=1024):
     """
@@ -71,51 +297,65 @@ def generar_claves(bits=1024):
     Returns:
         tuple: Una tupla que contiene dos tuplas:
             - (e, n): Clave pública.
-            - (d, n): Clave privada.
+            - (d, n, p, q, dp, dq, qinv, e): Clave privada, con los datos del Teorema Chino del Residuo
+              (dp = d mod (p-1), dq = d mod (q-1), qinv = q^-1 mod p) para acelerar el descifrado
+              y el exponente público e para el cegado.
 
     Nota:
-        - Requiere las funciones auxiliares `generar_primo` y `gcd`.
-        - El valor de 'e' se inicializa en 65537 y se ajusta si no es coprimo con phi.
+        - Requiere las funciones auxiliares `generar_primos_paralelo` y `gcd`.
+        - 'e' es el primer valor de `EXPONENTES_PUBLICOS` (65537 primero) que es coprimo con phi.
+
+    Raises:
+        ValueError: Si ninguno de `EXPONENTES_PUBLICOS` es coprimo con phi.
     """
-    p = generar_primo(bits // 2)
-    q = generar_primo(bits // 2)
+    p, q = generar_primos_paralelo(bits // 2)
     n = p * q
     phi = (p - 1) * (q - 1)
-    e = 65537
-    while gcd(e, phi) != 1:
-        e = random.randint(2, phi - 1)
+    for e in EXPONENTES_PUBLICOS:
+        if gcd(e, phi) == 1:
+            break
+    else:
+        raise ValueError("Ningún exponente público candidato es coprimo con phi")
     d = pow(e, -1, phi)
-    return (e, n), (d, n)
+    dp = d % (p - 1)
+    dq = d % (q - 1)
+    qinv = pow(q, -1, p)
+    return (e, n), (d, n, p, q, dp, dq, qinv, e)
 
 def cifrar_mensaje(mensaje, clave_publica):
     """
     Cifra un mensaje utilizando la clave pública RSA proporcionada.
 
     Divide el mensaje en bloques adecuados para el tamaño de la clave, convierte cada bloque a un entero,
-    y cifra cada bloque usando la fórmula RSA: c = m^e mod n.
+    y cifra cada bloque usando la fórmula RSA: c = m^e mod n (con `gmpy2.powmod` si está disponible).
+    Los bloques cifrados se escriben uno tras otro en un solo búfer, cada uno con el ancho fijo del módulo n
+    en bytes (big-endian).
 
     Args:
         mensaje (str): El mensaje de texto plano a cifrar.
         clave_publica (tuple): Una tupla (e, n) que representa la clave pública RSA.
 
     Returns:
-        list: Una lista de enteros, cada uno correspondiente a un bloque cifrado del mensaje.
+        bytearray: El mensaje cifrado, con un bloque de `(n.bit_length() + 7) // 8` bytes por cada bloque del mensaje.
 
     Raises:
-        ValueError: Si el mensaje es demasiado grande para la clave o si ocurre algún error durante el cifrado.
+        ValueError: Si la clave es demasiado pequeña para cifrar bloques de al menos un byte o si ocurre algún error durante el cifrado.
     """
     e, n = clave_publica
-    bloque_max = (n.bit_length() // 8) - 1
+    e_m, n_m = mpz(e), mpz(n)
+    # Con bloques de (n.bit_length() - 1) // 8 bytes, m < 256**bloque_max <= 2**(n.bit_length() - 1) <= n
+    bloque_max = (n.bit_length() - 1) // 8
     try:
-        bytes_msg = mensaje.encode('utf-8')
-        bloques = [bytes_msg[i:i+bloque_max] for i in range(0, len(bytes_msg), bloque_max)]
-        cifrados = []
-        for bloque in bloques:
-            m = int.from_bytes(bloque, 'big')
-            if m >= n:
-                raise ValueError("Mensaje demasiado grande para la clave")
-            c = pow(m, e, n)
-            cifrados.append(c)
+        if bloque_max < 1:
+            raise ValueError("Clave demasiado pequeña: n debe tener al menos 9 bits")
+        bytes_msg = memoryview(mensaje.encode('utf-8'))
+        ancho = (n.bit_length() + 7) // 8
+        num_bloques = -(-len(bytes_msg) // bloque_max)
+        cifrados = bytearray(ancho * num_bloques)
+        # Cada bloque se lee como vista sobre el mensaje codificado y se cifra en la misma pasada
+        for j in range(num_bloques):
+            m = int.from_bytes(bytes_msg[j*bloque_max:(j+1)*bloque_max], 'big')
+            cifrados[j*ancho:(j+1)*ancho] = int(powmod(m, e_m, n_m)).to_bytes(ancho, 'big')
         return cifrados
     except Exception as e:
         raise ValueError(f"Error al cifrar: {str(e)}")
@@ -125,47 +365,102 @@ def descifrar_mensaje(cifrados, clave_privada, clave_publica_original=None):
     Descifra un mensaje cifrado utilizando la clave privada RSA.
 
     Parámetros:
-        cifrados (list[int]): Lista de bloques cifrados (enteros) que representan el mensaje cifrado.
-        clave_privada (tuple[int, int]): Tupla (d, n) que representa la clave privada RSA.
+        cifrados (bytes): Mensaje cifrado tal como lo devuelve `cifrar_mensaje`: bloques de
+            `(n.bit_length() + 7) // 8` bytes concatenados.
+        clave_privada (tuple[int, ...]): Tupla (d, n) o (d, n, p, q, dp, dq, qinv, e) que representa la clave privada RSA.
+            Con la forma extendida de `generar_claves` el descifrado usa el Teorema Chino del Residuo.
         clave_publica_original (tuple[int, int], opcional): Tupla (e, n) de la clave pública original utilizada para cifrar. 
             Si se proporciona, se verifica que el módulo 'n' coincida con el de la clave privada.
 
     Retorna:
         str: El mensaje descifrado como una cadena de texto.
 
+    Nota:
+        - Si se conoce e (en la clave privada extendida o en `clave_publica_original`), cada bloque se descifra con
+          cegado RSA: se multiplica por r^e con r aleatorio y el resultado por r^-1, de modo que el tiempo de la
+          exponenciación no depende del bloque recibido.
+        - Los bloques se reconstruyen con el ancho fijo usado al cifrar, así que se conservan los bytes cero
+          iniciales de cada bloque; solo en el último bloque, cuya longitud no se conoce, se descartan.
+        - Con `gmpy2` las exponenciaciones con el exponente privado usan `gmpy2.powmod_sec`, cuyo tiempo no depende
+          de los bits del exponente.
+
     Lanza:
-        ValueError: Si las llaves no coinciden, si el resultado es vacío, o si ocurre un error durante el descifrado.
+        ValueError: Si las llaves no coinciden, si la longitud del cifrado no es múltiplo del ancho de bloque,
+            si el resultado es vacío, o si ocurre un error durante el descifrado.
     """
-    d, n = clave_privada
+    d, n = clave_privada[:2]
+    d_m, n_m = mpz(d), mpz(n)
+    usar_crt = len(clave_privada) == 8
+    e = None
+    if usar_crt:
+        p, q, dp, dq, qinv = map(mpz, clave_privada[2:7])
+        e = clave_privada[7]
     if clave_publica_original:
         e_original, n_original = clave_publica_original
         if n != n_original:
             raise ValueError("¡Las llaves no coinciden! El módulo 'n' es diferente")
+        if e is None:
+            e = e_original
     try:
-        bloques = []
-        for c in cifrados:
-            m = pow(c, d, n)
-            bloque = m.to_bytes((m.bit_length() + 7) // 8, 'big')
-            bloques.append(bloque)
-        mensaje = b''.join(bloques).decode('utf-8', errors='replace')
+        ancho = (n.bit_length() + 7) // 8
+        if len(cifrados) % ancho != 0:
+            raise ValueError(f"La longitud del cifrado no es múltiplo de {ancho} bytes")
+        vista = memoryview(cifrados)
+        # Mismo tamaño de bloque que `cifrar_mensaje`: todos los bloques salvo el último ocupan exactamente
+        # `bloque_max` bytes, aunque empiecen con bytes cero; el búfer se recorta al final
+        bloque_max = (n.bit_length() - 1) // 8
+        ultimo = len(vista) - ancho
+        salida = bytearray(len(vista) // ancho * bloque_max)
+        pos = 0
+        for i in range(0, len(vista), ancho):
+            c = int.from_bytes(vista[i:i+ancho], 'big')
+            if e is not None:
+                # r debe ser invertible módulo n (solo puede fallar con módulos pequeños)
+                r = mpz(secrets.randbelow(n - 1) + 1)
+                while gcd(r, n_m) != 1:
+                    r = mpz(secrets.randbelow(n - 1) + 1)
+                c = (c * powmod(r, e, n_m)) % n_m
+            if usar_crt:
+                # Dos exponenciaciones de la mitad de tamaño en lugar de una completa. Se dejan a GMP (o al `pow`
+                # de CPython, que ya usa ventanas en C): una ventana deslizante escrita en Python es más lenta
+                m1 = powmod_sec(c, dp, p)
+                m2 = powmod_sec(c, dq, q)
+                h = (qinv * (m1 - m2)) % p
+                m = int(m2 + h * q)
+            else:
+                m = int(powmod_sec(c, d_m, n_m))
+            if e is not None:
+                m = int((m * powmod(r, -1, n_m)) % n_m)
+            bloque = m.to_bytes(bloque_max, 'big')
+            if i == ultimo:
+                bloque = bloque.lstrip(b'\x00')
+            salida[pos:pos+len(bloque)] = bloque
+            pos += len(bloque)
+        del salida[pos:]
+        mensaje = salida.decode('utf-8', errors='replace')
         if not mensaje.strip():
             raise ValueError("Resultado vacío - probablemente las llaves son incorrectas")
         return mensaje
     except Exception as e:
         raise ValueError(f"Error al descifrar: {str(e)} - ¿Las llaves no coinciden?")
 
+# El menú no cambia entre iteraciones: se arma una sola vez y se imprime con una única escritura
+MENU = "\n".join([
+    "\n" + "="*50,
+    " RSA INTERACTIVO - VALIDACIÓN DE LLAVES",
+    "="*50,
+    "1. Generar nuevas claves",
+    "2. Cifrar mensaje (usar claves actuales)",
+    "3. Descifrar mensaje (usar claves actuales)",
+    "4. Probar descifrado con OTRAS llaves",
+    "5. Ver claves actuales",
+    "6. Probar primalidad",
+    "7. Salir",
+    "="*50,
+])
+
 def mostrar_menu():
-    print("\n" + "="*50)
-    print(" RSA INTERACTIVO - VALIDACIÓN DE LLAVES")
-    print("="*50)
-    print("1. Generar nuevas claves")
-    print("2. Cifrar mensaje (usar claves actuales)")
-    print("3. Descifrar mensaje (usar claves actuales)")
-    print("4. Probar descifrado con OTRAS llaves")
-    print("5. Ver claves actuales")
-    print("6. Probar primalidad")
-    print("7. Salir")
-    print("="*50)
+    print(MENU)
 
 def main():
     clave_publica = None
@@ -189,9 +484,8 @@ def main():
             mensaje = input("Mensaje a cifrar: ")
             try:
                 cifrado = cifrar_mensaje(mensaje, clave_publica)
-                print("\n[✓] Mensaje cifrado (bloques):")
-                print(", ".join(map(str, cifrado)))
-                print("Hexadecimal:", "|".join(hex(b)[2:] for b in cifrado))
+                print("\n[✓] Mensaje cifrado (hexadecimal):")
+                print(cifrado.hex())
             except ValueError as e:
                 print(f"[!] {e}")
 
@@ -200,9 +494,9 @@ def main():
                 print("[!] Genere claves primero (opción 1)")
                 continue
             try:
-                entrada = input("Ingrese bloques cifrados (separados por comas): ")
-                bloques = [int(b.strip()) for b in entrada.split(",")]
-                descifrado = descifrar_mensaje(bloques, clave_privada, clave_publica)
+                entrada = input("Ingrese el mensaje cifrado (hexadecimal): ")
+                cifrado = bytes.fromhex(entrada.strip())
+                descifrado = descifrar_mensaje(cifrado, clave_privada, clave_publica)
                 print("\n[✓] Mensaje descifrado:")
                 print(descifrado)
             except ValueError as e:
@@ -221,10 +515,10 @@ def main():
                 n_privado = int(input("Ingrese n (clave privada): "))
                 otra_publica = (e, n_publico)
                 otra_privada = (d, n_privado)
-                entrada = input("Bloques cifrados (separados por comas): ")
-                bloques = [int(b.strip()) for b in entrada.split(",")]
+                entrada = input("Mensaje cifrado (hexadecimal): ")
+                cifrado = bytes.fromhex(entrada.strip())
                 print("\n[?] Probando descifrado...")
-                descifrado = descifrar_mensaje(bloques, otra_privada, otra_publica)
+                descifrado = descifrar_mensaje(cifrado, otra_privada, otra_publica)
                 print("\n[✓] Descifrado exitoso con las nuevas llaves:")
                 print(descifrado)
                 if clave_publica and clave_privada:
@@ -253,7 +547,10 @@ def main():
         elif opcion == "6":
             num = int(input("Número a probar primalidad: "))
             if es_primo(num):
-                print(f"\n[✓] {num} ES primo (probabilísticamente)")
+                if num < COTA_DETERMINISTA:
+                    print(f"\n[✓] {num} ES primo")
+                else:
+                    print(f"\n[✓] {num} ES primo (probabilísticamente)")
             else:
                 print(f"\n[✗] {num} NO es primo")
 